@@ -9,57 +9,384 @@ parent ID, author, text, publication timestamp, and like count.
 from __future__ import annotations
 
 import argparse
+import base64
+import contextlib
 import csv
+import gzip
+import hashlib
+import http.client
+import io
 import json
+import os
 import shutil
 import multiprocessing
+import operator
+import random
+import re
+import sqlite3
 import sys
 import tempfile
+import threading
 import time
+import urllib.request
 from collections import deque
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from json.encoder import encode_basestring
 from pathlib import Path
-from typing import Callable, Dict, Iterable, Iterator, Optional, Sequence
-from urllib.error import HTTPError
-from urllib.parse import ParseResult, parse_qs, urlencode, urlparse
-from urllib.request import urlopen
+from typing import Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Sequence, Union
+from urllib.parse import quote_plus, unquote, urlencode, urlsplit
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib encoder.
+    orjson = None
 
 API_BASE = "https://www.googleapis.com/youtube/v3"
 DEFAULT_BUFFER_SIZE = 1000
 DEFAULT_PARALLELISM = 8
 DEFAULT_MAX_RPS = 25
+# Partial-response masks: request only the fields needed to build comment payloads.
+THREAD_FIELDS = (
+    "items(snippet/topLevelComment/id,"
+    "snippet/topLevelComment/snippet(authorDisplayName,likeCount,publishedAt,textOriginal),"
+    "snippet/totalReplyCount,"
+    "replies/comments(id,snippet(authorDisplayName,likeCount,publishedAt,textOriginal))),"
+    "nextPageToken,pageInfo/totalResults"
+)
+REPLY_FIELDS = "items(id,snippet(authorDisplayName,likeCount,publishedAt,textOriginal)),nextPageToken"
+_VIDEO_ID_RE = re.compile(r"[A-Za-z0-9_-]{11}")
+_VIDEO_URL_RE = re.compile(
+    r"(?:https?://)?"
+    r"(?:(?:www\.)?youtu\.be/|(?:www\.|m\.)?youtube\.com/(?:watch\?(?:[^#]*&)?v=|embed/|shorts/))"
+    r"([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])"
+)
+VIDEOS_PER_REQUEST = 50
+MAX_ATTEMPTS = 6
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+CONNECT_TIMEOUT = 5.0
+READ_TIMEOUT = 30.0
+POOL_MAXSIZE = 32
+DEFAULT_CONCURRENCY = 16
+PAGE_SIZE = 100
+PROGRESS_INTERVAL = 0.1
+WRITE_BUFFERING = 1 << 20
+READ_BUFFER_SIZE = 64 * 1024
+DEFAULT_CACHE_PATH = Path("~") / ".cache" / "yt-commcollect" / "responses.sqlite3"
+DEFAULT_CACHE_TTL = 7 * 86400
+
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+
+    # Idle read buffers shared by all threads of the process, so short-lived
+    # prefetch and reply threads reuse them instead of allocating their own.
+    _READ_BUFFERS: list[bytearray] = []
+    _READ_BUFFERS_LOCK = threading.Lock()
+
+    def _load(fp: io.BufferedIOBase) -> Dict:
+        """Parse a JSON document read from ``fp``.
+
+        orjson only parses whole buffers, so the body is read into a pooled
+        bytearray that is reused, and grown as needed, across responses.
+        """
+        with _READ_BUFFERS_LOCK:
+            buf = _READ_BUFFERS.pop() if _READ_BUFFERS else None
+        if buf is None:
+            buf = bytearray(READ_BUFFER_SIZE)
+        try:
+            size = 0
+            while True:
+                if size == len(buf):
+                    buf.extend(bytes(len(buf)))
+                read = fp.readinto(memoryview(buf)[size:])
+                if not read:
+                    break
+                size += read
+            return orjson.loads(memoryview(buf)[:size])
+        finally:
+            with _READ_BUFFERS_LOCK:
+                if len(_READ_BUFFERS) < POOL_MAXSIZE:
+                    _READ_BUFFERS.append(buf)
+
+else:
+    _loads = json.loads
+    _load = json.load
+
+    def _dumps(obj: object) -> bytes:
+        """Serialize ``obj`` as compact UTF-8 JSON, matching ``orjson.dumps``."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 
 class RateLimiter:
-    """A lightweight per-process rate limiter using a sliding window."""
+    """A lightweight rate limiter allowing a one-second burst, shared across processes when given ``mp_context``."""
 
-    def __init__(self, max_requests_per_second: float) -> None:
+    __slots__ = ("max_requests_per_second", "_ns_per_token", "_burst_ns", "_state", "_lock")
+
+    def __init__(
+        self, max_requests_per_second: float, *, mp_context: Optional[multiprocessing.context.BaseContext] = None
+    ) -> None:
         self.max_requests_per_second = max_requests_per_second
-        self._timestamps: deque[float] = deque()
+        self._ns_per_token = round(1e9 / max_requests_per_second) if max_requests_per_second > 0 else 0
+        self._burst_ns = max(self._ns_per_token, 10**9) - self._ns_per_token
+        # Scheduler state: [monotonic_ns at which the next request is due].
+        initial = [time.monotonic_ns()]
+        if mp_context is None:
+            self._state = initial
+            self._lock = threading.Lock()
+        else:
+            self._state = mp_context.Array("q", initial, lock=False)
+            self._lock = mp_context.Lock()
 
     def acquire(self) -> None:
-        if self.max_requests_per_second <= 0:
+        cost = self._ns_per_token
+        if not cost:
             return
 
-        now = time.monotonic()
-        window_start = now - 1.0
+        with self._lock:
+            state = self._state
+            now = time.monotonic_ns()
+            due = max(state[0], now)
+            state[0] = due + cost
+        wait = due - self._burst_ns - now
+        if wait > 0:
+            time.sleep(wait / 1e9)
+
+
+class _HttpResponse:
+    """A completed HTTP response.
+
+    Successful bodies are decoded as JSON while they are read from the socket;
+    error bodies are kept as raw bytes in ``content``.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        reason: str,
+        headers: http.client.HTTPMessage,
+        *,
+        data: Optional[Dict] = None,
+        content: Optional[bytes] = None,
+    ) -> None:
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self._data = data
+
+    @property
+    def text(self) -> str:
+        return (self.content or b"").decode("utf-8", errors="ignore")
+
+    def json(self) -> Dict:
+        return self._data if self.content is None else json.loads(self.content)
+
+
+class _HttpSession:
+    """A small keep-alive HTTPS client keeping up to ``max_idle`` idle connections per host."""
+
+    _HEADERS = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+
+    def __init__(
+        self,
+        *,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        read_timeout: float = READ_TIMEOUT,
+        max_idle: int = POOL_MAXSIZE,
+    ) -> None:
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._idle: Dict[str, list[http.client.HTTPSConnection]] = {}
+
+    def _checkout(self, host: str) -> Optional[http.client.HTTPSConnection]:
+        with self._lock:
+            if self._pid != os.getpid():
+                # Never reuse sockets inherited from the parent across a fork.
+                self._pid = os.getpid()
+                self._idle = {}
+            idle = self._idle.get(host)
+            return idle.pop() if idle else None
+
+    def _checkin(self, host: str, connection: http.client.HTTPSConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(host, [])
+            if self._pid == os.getpid() and len(idle) < self.max_idle:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _connect(self, host: str) -> http.client.HTTPSConnection:
+        proxy = urllib.request.getproxies().get("https")
+        if not proxy or urllib.request.proxy_bypass(host):
+            connection = http.client.HTTPSConnection(host, timeout=self.connect_timeout)
+        else:
+            # Tunnel through the proxy from HTTPS_PROXY, as urllib would.
+            proxy_url = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+            connection = http.client.HTTPSConnection(
+                proxy_url.hostname, proxy_url.port or 8080, timeout=self.connect_timeout
+            )
+            headers = {}
+            if proxy_url.username:
+                credentials = f"{unquote(proxy_url.username)}:{unquote(proxy_url.password or '')}"
+                headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode()).decode("ascii")
+            connection.set_tunnel(host, headers=headers)
+        connection.connect()
+        connection.sock.settimeout(self.read_timeout)
+        return connection
+
+    @staticmethod
+    def _body(response: http.client.HTTPResponse) -> io.BufferedIOBase:
+        if response.getheader("Content-Encoding", "").lower() == "gzip":
+            return gzip.GzipFile(fileobj=response)
+        return response
+
+    def get(self, url: str) -> _HttpResponse:
+        """GET ``url``, decoding a successful body as it is read from the socket."""
+
+        parts = urlsplit(url)
+        target = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        connection = self._checkout(parts.netloc)
+        reused = connection is not None
+
+        while True:
+            if connection is None:
+                connection = self._connect(parts.netloc)
+            try:
+                connection.request("GET", target, headers=self._HEADERS)
+                response = connection.getresponse()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                connection.close()
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive connection; retry once on a fresh one.
+                connection, reused = None, False
+            except BaseException:
+                connection.close()
+                raise
+
+        try:
+            body = self._body(response)
+            if response.status >= 400:
+                result = _HttpResponse(response.status, response.reason, response.headers, content=body.read())
+            else:
+                result = _HttpResponse(response.status, response.reason, response.headers, data=_load(body))
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.will_close or not response.isclosed():
+            connection.close()
+        else:
+            self._checkin(parts.netloc, connection)
 
-        while self._timestamps and self._timestamps[0] < window_start:
-            self._timestamps.popleft()
+        return result
 
-        if len(self._timestamps) >= self.max_requests_per_second:
-            earliest = self._timestamps[0]
-            sleep_for = max(0.0, 1.0 - (now - earliest))
-            if sleep_for:
-                time.sleep(sleep_for)
 
-        self._timestamps.append(time.monotonic())
+_SESSION = _HttpSession()
 
 
-class QuotaExceededError(RuntimeError):
+class _ResponseCache:
+    """Persistent SQLite cache of successful API responses keyed by a hash of the request URL.
+
+    Database errors are treated as cache misses.
+    """
+
+    def __init__(self, path: Path, *, ttl: float = DEFAULT_CACHE_TTL) -> None:
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        """Return this process's connection; call with ``_lock`` held."""
+        if self._pid != os.getpid():
+            # Never reuse a connection inherited across a fork.
+            self._pid = os.getpid()
+            self._conn = None
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS responses "
+                    "(key TEXT PRIMARY KEY, expires REAL NOT NULL, body BLOB NOT NULL)"
+                )
+                with db:
+                    db.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+            except (OSError, sqlite3.Error):
+                # Leave this process uncached rather than retrying the open on every request.
+                return None
+            self._conn = db
+        return self._conn
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.blake2b(url.encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> Optional[Dict]:
+        key = self._key(url)
+        with self._lock:
+            db = self._db()
+            if db is None:
+                return None
+            try:
+                row = db.execute(
+                    "SELECT body FROM responses WHERE key = ? AND expires > ?", (key, time.time())
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        return _loads(row[0]) if row else None
+
+    def set(self, url: str, data: Dict) -> None:
+        row = (self._key(url), time.time() + self.ttl, _dumps(data))
+        with self._lock:
+            db = self._db()
+            if db is None:
+                return
+            try:
+                with db:
+                    db.execute("INSERT OR REPLACE INTO responses (key, expires, body) VALUES (?, ?, ?)", row)
+            except sqlite3.Error:
+                pass
+
+
+# Configured by ``main``; ``None`` disables response caching.
+_RESPONSE_CACHE: Optional[_ResponseCache] = None
+
+
+class ApiError(RuntimeError):
+    """Raised when a YouTube Data API request fails."""
+
+
+class QuotaExceededError(ApiError):
     """Raised when the YouTube Data API indicates the quota has been exceeded."""
 
 
+class RateLimitError(ApiError):
+    """Raised when the YouTube Data API still rejects a request as too frequent after every retry."""
+
+
+# Exception raised for each ``error.errors[0].reason`` of a failed request; others raise ``ApiError``.
+_REASON_MAP = {
+    "quotaExceeded": QuotaExceededError,
+    "rateLimitExceeded": RateLimitError,
+    "userRateLimitExceeded": RateLimitError,
+}
+
+_QUOTA_HELP = (
+    "YouTube Data API quota exceeded. Request more quota at "
+    "https://developers.google.com/youtube/v3/getting-started#quota, wait for the "
+    "daily reset, or reduce concurrent downloads before retrying."
+)
+
+
 def load_api_key(token_path: Path) -> str:
     """Load the YouTube Data API key from the provided path."""
     if not token_path.exists():
@@ -77,62 +404,140 @@ def load_api_key(token_path: Path) -> str:
 def extract_video_id(url_or_id: str) -> str:
     """Extract the YouTube video ID from a URL or return the input if it already looks like an ID."""
 
-    # Heuristic: if the string has no URL components, treat it as an ID
-    parsed: ParseResult = urlparse(url_or_id)
-    if not parsed.scheme and not parsed.netloc and len(url_or_id) == 11:
+    # Heuristic: a bare 11-character ID is returned as-is.
+    if _VIDEO_ID_RE.fullmatch(url_or_id):
         return url_or_id
 
-    if parsed.netloc in {"youtu.be", "www.youtu.be"}:
-        # Short link: https://youtu.be/<id>
-        return parsed.path.lstrip("/")
-
-    if parsed.netloc in {"youtube.com", "www.youtube.com", "m.youtube.com"}:
-        if parsed.path.startswith("/watch"):
-            query = parse_qs(parsed.query)
-            if "v" in query:
-                return query["v"][0]
-        # Embedded form: https://www.youtube.com/embed/<id>
-        if parsed.path.startswith("/embed/"):
-            return parsed.path.split("/", maxsplit=2)[2]
-        # Shorts: https://www.youtube.com/shorts/<id>
-        if parsed.path.startswith("/shorts/"):
-            return parsed.path.split("/", maxsplit=2)[2]
+    # youtu.be/<id>, youtube.com/watch?v=<id>, youtube.com/embed/<id> and youtube.com/shorts/<id>
+    match = _VIDEO_URL_RE.match(url_or_id)
+    if match:
+        return match.group(1)
 
     raise ValueError(f"Unable to extract video ID from '{url_or_id}'. Provide a standard YouTube URL or video ID.")
 
 
-def _perform_get(endpoint: str, params: Dict[str, str], *, rate_limiter: RateLimiter) -> Dict:
-    """Perform a GET request against the YouTube Data API and parse JSON response."""
+def _retry_delay(response: Optional[_HttpResponse], attempt: int) -> float:
+    """Seconds to wait before retrying ``response``, honoring ``Retry-After`` when present."""
 
-    rate_limiter.acquire()
-    encoded = urlencode(params)
-    url = f"{API_BASE}/{endpoint}?{encoded}"
+    retry_after = response.headers.get("Retry-After") if response is not None and response.headers else None
     try:
-        with urlopen(url) as response:
-            return json.loads(response.read())
-    except HTTPError as err:
-        error_detail = err.read().decode("utf-8", errors="ignore") if err.fp else err.reason
-
-        quota_help = (
-            "YouTube Data API quota exceeded. Request more quota at "
-            "https://developers.google.com/youtube/v3/getting-started#quota, wait for the "
-            "daily reset, or reduce concurrent downloads before retrying."
-        )
+        delay = float(retry_after) if retry_after else float(2**attempt)
+    except ValueError:
+        # Retry-After may also be an HTTP date; fall back to exponential backoff.
+        delay = float(2**attempt)
+    return delay + random.random()
+
+
+# Parameters that are the same for every request to an endpoint, URL-encoded once.
+_STATIC_QUERIES = {
+    "commentThreads": urlencode(
+        {
+            # ``replies`` inlines up to five replies per thread, saving a round trip for small threads.
+            "part": "snippet,replies",
+            "maxResults": PAGE_SIZE,
+            "textFormat": "plainText",
+            "fields": THREAD_FIELDS,
+        }
+    ),
+    "comments": urlencode(
+        {"part": "snippet", "maxResults": PAGE_SIZE, "textFormat": "plainText", "fields": REPLY_FIELDS}
+    ),
+    "videos": urlencode({"part": "statistics", "fields": "items(id,statistics/commentCount)"}),
+}
 
+
+def _error_details(response: _HttpResponse) -> tuple[str, Optional[str]]:
+    """Return the message and first reason of an API error body, parsed once."""
+    try:
+        payload = response.json()
+    except ValueError:
+        return "", None
+    error_block = payload.get("error") if isinstance(payload, dict) else None
+    if not isinstance(error_block, dict):
+        return "", None
+    errors = error_block.get("errors") or [{}]
+    reason = errors[0].get("reason") if isinstance(errors[0], dict) else None
+    return error_block.get("message") or "", reason
+
+
+def _perform_get(endpoint: str, params: Dict[str, str], *, rate_limiter: RateLimiter) -> Dict:
+    """Perform a GET request against the YouTube Data API and parse JSON response.
+
+    Transient and rate-limit errors are retried with exponential backoff.
+    """
+
+    query = "&".join([f"{name}={quote_plus(value)}" if value else f"{name}=" for name, value in params.items()])
+    url = f"{API_BASE}/{endpoint}?{_STATIC_QUERIES[endpoint]}&{query}"
+    cache = _RESPONSE_CACHE
+    if cache is not None:
+        cached = cache.get(url)
+        if cached is not None:
+            return cached
+
+    for attempt in range(MAX_ATTEMPTS):
+        rate_limiter.acquire()
         try:
-            payload = json.loads(error_detail)
-            error_block = payload.get("error", {}) if isinstance(payload, dict) else {}
-            message = error_block.get("message", "")
-            errors = error_block.get("errors") or []
-            reason = errors[0].get("reason") if errors and isinstance(errors[0], dict) else None
-
-            if reason == "quotaExceeded" or "quota" in message.lower():
-                raise QuotaExceededError(f"{message} {quota_help}".strip())
-        except json.JSONDecodeError:
-            # Leave handling to the generic RuntimeError below if the body is not JSON.
-            pass
+            response = _SESSION.get(url)
+        except (OSError, http.client.HTTPException) as exc:
+            if attempt < MAX_ATTEMPTS - 1:
+                time.sleep(_retry_delay(None, attempt))
+                continue
+            raise ApiError(f"API request failed: {exc}") from exc
+        if response.status_code < 400:
+            data = response.json()
+            break
+        if response.status_code in RETRYABLE_STATUSES and attempt < MAX_ATTEMPTS - 1:
+            time.sleep(_retry_delay(response, attempt))
+            continue
+
+        message, reason = _error_details(response)
+        error_class = _REASON_MAP.get(reason, ApiError)
+        if error_class is QuotaExceededError or (error_class is ApiError and "quota" in message.lower()):
+            raise QuotaExceededError(f"{message} {_QUOTA_HELP}".strip())
+        if error_class is RateLimitError and attempt < MAX_ATTEMPTS - 1:
+            # YouTube reports short-term rate limiting as 403; back off like a 429.
+            time.sleep(_retry_delay(response, attempt))
+            continue
+        raise error_class(f"API request failed ({response.status_code}): {response.text or response.reason}")
+
+    if cache is not None:
+        cache.set(url, data)
+    return data
+
+
+def _iter_pages(endpoint: str, params: Dict[str, str], *, rate_limiter: RateLimiter) -> Iterator[Dict]:
+    """Iterate over the pages of a paginated endpoint.
+
+    As soon as a page reveals a ``nextPageToken`` the following page is
+    requested on a background thread, so its round trip overlaps with the
+    caller consuming the current page.
+    """
+
+    executor: Optional[ThreadPoolExecutor] = None
+    next_page: Optional[Future] = None
+    try:
+        data = _perform_get(endpoint, params, rate_limiter=rate_limiter)
+        while True:
+            page_token = data.get("nextPageToken")
+            next_page = None
+            if page_token:
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=1)
+                next_page = executor.submit(
+                    _perform_get, endpoint, {**params, "pageToken": page_token}, rate_limiter=rate_limiter
+                )
+
+            yield data
 
-        raise RuntimeError(f"API request failed ({err.code}): {error_detail}")
+            if next_page is None:
+                break
+            data = next_page.result()
+    finally:
+        if executor is not None:
+            # A page the caller abandoned is not fetched (``cancel_futures`` needs Python 3.9).
+            if next_page is not None:
+                next_page.cancel()
+            executor.shutdown(wait=False)
 
 
 def iter_comment_threads(
@@ -144,23 +549,11 @@ def iter_comment_threads(
     reported by the API (when available) to facilitate progress estimation.
     """
 
-    page_token: Optional[str] = None
     total_threads_reported: Optional[int] = None
     reported_total = False
 
-    while True:
-        params = {
-            "part": "snippet",
-            "videoId": video_id,
-            "maxResults": "100",
-            "textFormat": "plainText",
-            "pageToken": page_token or "",
-            # Request only the fields needed for building the payload to reduce payload size.
-            "fields": "items(id,snippet/topLevelComment/id,snippet/topLevelComment/snippet(authorDisplayName,likeCount,publishedAt,textOriginal),snippet/totalReplyCount),nextPageToken,pageInfo/totalResults",
-            "key": api_key,
-        }
-        data = _perform_get("commentThreads", params, rate_limiter=rate_limiter)
-
+    params = {"videoId": video_id, "pageToken": "", "key": api_key}
+    for data in _iter_pages("commentThreads", params, rate_limiter=rate_limiter):
         if total_threads_reported is None:
             total_threads_reported = data.get("pageInfo", {}).get("totalResults")
 
@@ -168,46 +561,89 @@ def iter_comment_threads(
             yield thread, None if reported_total else total_threads_reported
             reported_total = True
 
-        page_token = data.get("nextPageToken")
-        if not page_token:
-            break
-
 
 def iter_replies(parent_id: str, api_key: str, *, rate_limiter: RateLimiter) -> Iterator[Dict]:
     """Iterate over all first-degree replies to a top-level comment."""
-    page_token: Optional[str] = None
+    params = {"parentId": parent_id, "pageToken": "", "key": api_key}
+    for data in _iter_pages("comments", params, rate_limiter=rate_limiter):
+        yield from data.get("items", [])
 
-    while True:
-        params = {
-            "part": "snippet",
-            "parentId": parent_id,
-            "maxResults": "100",
-            "textFormat": "plainText",
-            "pageToken": page_token or "",
-            # Partial response for reply payload construction only.
-            "fields": "items(id,snippet/authorDisplayName,snippet/likeCount,snippet/publishedAt,snippet/textOriginal),nextPageToken",
-            "key": api_key,
-        }
-        data = _perform_get("comments", params, rate_limiter=rate_limiter)
 
+def fetch_comment_counts(video_ids: Sequence[str], api_key: str, *, rate_limiter: RateLimiter) -> Dict[str, int]:
+    """Return the reported comment count of each video, batching IDs per request.
+
+    Videos missing from the response (deleted, private or with comments
+    disabled) are omitted.
+    """
+
+    counts: Dict[str, int] = {}
+    for start in range(0, len(video_ids), VIDEOS_PER_REQUEST):
+        params = {"id": ",".join(video_ids[start : start + VIDEOS_PER_REQUEST]), "key": api_key}
+        data = _perform_get("videos", params, rate_limiter=rate_limiter)
         for item in data.get("items", []):
-            yield item
+            counts[item["id"]] = int(item.get("statistics", {}).get("commentCount", 0))
+    return counts
 
-        page_token = data.get("nextPageToken")
-        if not page_token:
-            break
+
+class Comment(NamedTuple):
+    """A single top-level comment or reply, in output column order."""
+
+    id: Optional[str]
+    parent_id: Optional[str]
+    author: Optional[str]
+    text: Optional[str]
+    published_at: Optional[str]
+    like_count: int
+
+
+_COMMENT_TEMPLATE = "{" + ",".join(f'"{field}":%s' for field in Comment._fields) + "}"
 
 
-def build_comment_payload(item: Dict, *, parent_id: Optional[str] = None) -> Dict[str, object]:
+def _json_value(value: object) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, str):
+        return encode_basestring(value)
+    return json.dumps(value)
+
+
+def _serialize_comment_stdlib(comment: Comment) -> bytes:
+    """Serialize ``comment`` as a JSON object without building an intermediate dict."""
+    return (_COMMENT_TEMPLATE % tuple(map(_json_value, comment))).encode("utf-8")
+
+
+if orjson is not None:
+
+    def _serialize_comment(comment: Comment) -> bytes:
+        return orjson.dumps(comment._asdict())
+
+else:
+    _serialize_comment = _serialize_comment_stdlib
+
+
+# Snippet fields in Comment order, pulled with a single C-level call.
+_SNIPPET_FIELDS = operator.itemgetter("authorDisplayName", "textOriginal", "publishedAt", "likeCount")
+
+
+def build_comment_payload(item: Dict, *, parent_id: Optional[str] = None) -> Comment:
     snippet = item["snippet"]
-    return {
-        "id": item.get("id"),
-        "parent_id": parent_id,
-        "author": snippet.get("authorDisplayName"),
-        "text": snippet.get("textOriginal"),
-        "published_at": snippet.get("publishedAt"),
-        "like_count": snippet.get("likeCount", 0),
-    }
+    try:
+        author, text, published_at, like_count = _SNIPPET_FIELDS(snippet)
+    except KeyError:
+        # Fields may be absent from a partial response; fall back to defaults.
+        author = snippet.get("authorDisplayName")
+        text = snippet.get("textOriginal")
+        published_at = snippet.get("publishedAt")
+        like_count = snippet.get("likeCount", 0)
+    return Comment._make((item.get("id"), parent_id, author, text, published_at, like_count))
+
+
+def _drain_replies(parent_id: str, api_key: str, rate_limiter: RateLimiter) -> list[Comment]:
+    """Fetch every reply to ``parent_id`` and build their payloads."""
+    return [
+        build_comment_payload(reply, parent_id=parent_id)
+        for reply in iter_replies(parent_id, api_key, rate_limiter=rate_limiter)
+    ]
 
 
 def collect_comments(
@@ -216,33 +652,73 @@ def collect_comments(
     *,
     rate_limiter: RateLimiter,
     progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
-) -> Iterable[Dict[str, object]]:
-    """Yield all comments (top-level and first-degree replies) for the video."""
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Iterable[Comment]:
+    """Yield all comments (top-level and first-degree replies) for the video.
+
+    Replies missing from the thread listing are fetched on up to
+    ``concurrency`` threads; comments are still yielded in thread order.
+    """
+
+    window = max(PAGE_SIZE, 2 * max(1, concurrency))
 
     total_estimated: Optional[int] = None
     processed = 0
+    pending: deque[tuple[Comment, Union[Future, list]]] = deque()
+
+    last_report = float("-inf")
+
+    def emit(entry: tuple[Comment, Union[Future, list]]) -> Iterator[Comment]:
+        nonlocal processed, last_report
+        top_payload, replies = entry
+        if isinstance(replies, Future):
+            replies = replies.result()
+        for comment in [top_payload, *replies]:
+            processed += 1
+            # Report at most every PROGRESS_INTERVAL seconds rather than per comment.
+            if progress_callback and time.monotonic() - last_report >= PROGRESS_INTERVAL:
+                last_report = time.monotonic()
+                progress_callback(processed, total_estimated)
+            yield comment
+
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    try:
+        for thread, thread_total in iter_comment_threads(video_id, api_key, rate_limiter=rate_limiter):
+            if total_estimated is None and thread_total is not None:
+                total_estimated = thread_total
 
-    for thread, thread_total in iter_comment_threads(video_id, api_key, rate_limiter=rate_limiter):
-        if total_estimated is None and thread_total is not None:
-            total_estimated = thread_total
+            top_comment = thread["snippet"]["topLevelComment"]
+            total_replies = thread["snippet"].get("totalReplyCount", 0)
+            if total_replies and total_estimated is not None:
+                total_estimated += total_replies
 
-        top_comment = thread["snippet"]["topLevelComment"]
-        processed += 1
-        if progress_callback:
-            progress_callback(processed, total_estimated)
-        yield build_comment_payload(top_comment, parent_id=None)
+            parent_id = top_comment.get("id")
+            inline_replies = thread.get("replies", {}).get("comments", [])
+            if total_replies > len(inline_replies):
+                replies = executor.submit(_drain_replies, parent_id, api_key, rate_limiter)
+            else:
+                replies = [build_comment_payload(reply, parent_id=parent_id) for reply in inline_replies]
+            pending.append((build_comment_payload(top_comment, parent_id=None), replies))
 
-        total_replies = thread["snippet"].get("totalReplyCount", 0)
-        if total_replies and total_estimated is not None:
-            total_estimated += total_replies
+            # Emit completed threads in order; block on the oldest one once the window is full.
+            while pending and (
+                len(pending) >= window
+                or not isinstance(pending[0][1], Future)
+                or pending[0][1].done()
+            ):
+                yield from emit(pending.popleft())
 
-        if total_replies:
-            parent_id = top_comment.get("id")
-            for reply in iter_replies(parent_id, api_key, rate_limiter=rate_limiter):
-                processed += 1
-                if progress_callback:
-                    progress_callback(processed, total_estimated)
-                yield build_comment_payload(reply, parent_id=parent_id)
+        while pending:
+            yield from emit(pending.popleft())
+
+        if progress_callback and processed:
+            progress_callback(processed, total_estimated)
+    finally:
+        # Skip reply listings the caller will never consume (``cancel_futures`` needs Python 3.9).
+        for _, replies in pending:
+            if isinstance(replies, Future):
+                replies.cancel()
+        executor.shutdown(wait=False)
 
 
 def print_progress(processed: int, total: Optional[int]) -> None:
@@ -254,69 +730,240 @@ def print_progress(processed: int, total: Optional[int]) -> None:
     print(f"\r{line}", end="", flush=True)
 
 
-def _write_buffer(outfile, buffer: list[Dict[str, object]]) -> None:
-    if not buffer:
-        return
-    for comment in buffer:
-        outfile.write(json.dumps(comment, ensure_ascii=False) + "\n")
-    buffer.clear()
+class BufferLimit(NamedTuple):
+    """When ``_WriteBuffer`` flushes: after ``records`` comments, or once ``nbytes`` are buffered."""
+
+    records: int = 0
+    nbytes: int = 0
+
+
+_BYTE_SIZE_RE = re.compile(r"(\d+)\s*([KMG])(?:i?B)?", re.IGNORECASE)
+_BYTE_SIZE_SHIFTS = {"K": 10, "M": 20, "G": 30}
+
+
+def parse_buffer_size(value: str) -> Union[BufferLimit, str]:
+    """Parse ``--buffer-size``: a comment count, a byte size such as ``256K`` or ``4M``, or ``auto``."""
+    value = value.strip()
+    if value.lower() == "auto":
+        return "auto"
+    if value.isdigit():
+        return BufferLimit(records=int(value))
+    match = _BYTE_SIZE_RE.fullmatch(value)
+    if match is None:
+        raise argparse.ArgumentTypeError(
+            f"invalid buffer size {value!r}; use a comment count, a byte size such as 256K, or auto"
+        )
+    return BufferLimit(nbytes=int(match[1]) << _BYTE_SIZE_SHIFTS[match[2].upper()])
+
+
+def _auto_buffer_limit(directory: Path) -> BufferLimit:
+    """Flush in units of a few file system blocks of the output directory."""
+    try:
+        block_size = os.statvfs(directory).f_bsize
+    except (AttributeError, OSError):
+        block_size = 4096
+    return BufferLimit(nbytes=max(4096, 4 * block_size))
+
+
+class _WriteBuffer:
+    """Accumulates serialized comments in a single reusable ``bytearray``.
+
+    The buffer is written to ``outfile`` and flushed once ``limit`` is reached.
+    """
+
+    __slots__ = ("outfile", "max_records", "max_bytes", "_buffer", "_records")
+
+    def __init__(self, outfile, limit: Union[int, BufferLimit]) -> None:
+        if isinstance(limit, int):
+            limit = BufferLimit(records=limit)
+        self.outfile = outfile
+        if limit.nbytes:
+            self.max_records, self.max_bytes = sys.maxsize, limit.nbytes
+        else:
+            self.max_records, self.max_bytes = max(1, limit.records), sys.maxsize
+        self._buffer = bytearray()
+        self._records = 0
+
+    def write(self, comment: Comment) -> None:
+        buffer = self._buffer
+        buffer += _serialize_comment(comment)
+        buffer += b"\n"
+        self._records += 1
+        if self._records >= self.max_records or len(buffer) >= self.max_bytes:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self.outfile.write(self._buffer)
+            self.outfile.flush()
+            self._buffer.clear()
+        self._records = 0
+
+
+def write_video_comments(
+    video_id: str,
+    api_key: str,
+    outfile,
+    buffer_size: Union[int, BufferLimit],
+    rate_limiter: RateLimiter,
+    *,
+    show_progress: bool,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> int:
+    """Write all comments of ``video_id`` as JSON Lines to the binary ``outfile``."""
+
+    progress_cb: Optional[Callable[[int, Optional[int]], None]] = print_progress if show_progress else None
+    written = 0
+    buffer = _WriteBuffer(outfile, buffer_size)
+    for comment in collect_comments(
+        video_id,
+        api_key,
+        rate_limiter=rate_limiter,
+        progress_callback=progress_cb,
+        concurrency=concurrency,
+    ):
+        buffer.write(comment)
+        written += 1
+    buffer.flush()
+
+    if show_progress:
+        print()
+
+    return written
 
 
 def download_video_comments(
     video_input: str,
     api_key: str,
     temp_dir: Path,
-    buffer_size: int,
-    max_rps: float,
+    buffer_size: Union[int, BufferLimit],
+    rate_limiter: RateLimiter,
     *,
     show_progress: bool,
+    concurrency: int = DEFAULT_CONCURRENCY,
 ) -> tuple[str, Path, int]:
     video_id = extract_video_id(video_input)
     temp_path = temp_dir / f"{video_id}.jsonl"
-    rate_limiter = RateLimiter(max_requests_per_second=max_rps)
 
-    progress_cb: Optional[Callable[[int, Optional[int]], None]] = print_progress if show_progress else None
-    written = 0
-    buffer: list[Dict[str, object]] = []
-    with temp_path.open("w", encoding="utf-8") as outfile:
-        for comment in collect_comments(
+    with temp_path.open("wb", buffering=WRITE_BUFFERING) as outfile:
+        written = write_video_comments(
             video_id,
             api_key,
-            rate_limiter=rate_limiter,
-            progress_callback=progress_cb,
-        ):
-            buffer.append(comment)
-            written += 1
-            if len(buffer) >= buffer_size:
-                _write_buffer(outfile, buffer)
-        _write_buffer(outfile, buffer)
-
-    if show_progress:
-        print()
+            outfile,
+            buffer_size,
+            rate_limiter,
+            show_progress=show_progress,
+            concurrency=concurrency,
+        )
 
     return video_id, temp_path, written
 
 
-def merge_temp_files(temp_files: Sequence[Path], output_path: Path) -> None:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as outfile:
-        for path in temp_files:
-            with path.open("r", encoding="utf-8") as infile:
-                shutil.copyfileobj(infile, outfile)
+# Per-process job settings, installed once by ``_init_worker`` so that each
+# submitted task only has to carry its video.
+_WORKER_API_KEY: Optional[str] = None
+_WORKER_TEMP_DIR: Optional[Path] = None
+_WORKER_BUFFER_SIZE: Union[int, BufferLimit] = DEFAULT_BUFFER_SIZE
+_WORKER_RATE_LIMITER: Optional[RateLimiter] = None
+_WORKER_CONCURRENCY = DEFAULT_CONCURRENCY
+
+
+def _init_worker(
+    api_key: str,
+    temp_dir: Path,
+    buffer_size: Union[int, BufferLimit],
+    rate_limiter: RateLimiter,
+    concurrency: int,
+    cache_path: Optional[Path],
+) -> None:
+    global _WORKER_API_KEY, _WORKER_TEMP_DIR, _WORKER_BUFFER_SIZE, _WORKER_RATE_LIMITER, _WORKER_CONCURRENCY
+    global _RESPONSE_CACHE
+    _WORKER_API_KEY = api_key
+    _WORKER_TEMP_DIR = temp_dir
+    _WORKER_BUFFER_SIZE = buffer_size
+    _WORKER_RATE_LIMITER = rate_limiter
+    _WORKER_CONCURRENCY = concurrency
+    _RESPONSE_CACHE = _ResponseCache(cache_path) if cache_path is not None else None
+
+
+def _download_in_worker(video_input: str) -> tuple[str, Path, int]:
+    return download_video_comments(
+        video_input,
+        _WORKER_API_KEY,
+        _WORKER_TEMP_DIR,
+        _WORKER_BUFFER_SIZE,
+        _WORKER_RATE_LIMITER,
+        show_progress=False,
+        concurrency=_WORKER_CONCURRENCY,
+    )
+
+
+# In-kernel copy primitives, best first, as ``copy(src_fd, dst_fd, src_offset, count)``.
+# ``copy_file_range`` can share extents on file systems that support it;
+# ``sendfile`` still avoids copying through userspace.
+_KERNEL_COPIES: list[Callable[[int, int, int, int], int]] = []
+if hasattr(os, "copy_file_range"):
+    _KERNEL_COPIES.append(lambda src, dst, offset, count: os.copy_file_range(src, dst, count, offset))
+if hasattr(os, "sendfile"):
+    _KERNEL_COPIES.append(lambda src, dst, offset, count: os.sendfile(dst, src, offset, count))
+
+
+def _append_file(infile, outfile) -> None:
+    """Append ``infile`` to ``outfile``, copying in the kernel where supported."""
+
+    outfile.flush()
+    size = os.fstat(infile.fileno()).st_size
+    offset = 0
+    for copy in _KERNEL_COPIES:
+        try:
+            while offset < size:
+                copied = copy(infile.fileno(), outfile.fileno(), offset, size - offset)
+                if not copied:
+                    # Some file systems report 0 instead of failing; finish with the next primitive.
+                    break
+                offset += copied
+        except OSError:
+            # Unsupported for this platform or pair of file systems; try the next primitive.
+            pass
+        if offset == size:
+            return
+
+    infile.seek(offset)
+    shutil.copyfileobj(infile, outfile, WRITE_BUFFERING)
+
+
+@contextlib.contextmanager
+def _atomic_output(output_path: Path) -> Iterator[io.BufferedWriter]:
+    """Write ``output_path`` via a sibling partial file that replaces it only on success.
+
+    A single ``fsync`` before the rename makes the finished output durable;
+    an interrupted run leaves any previous output untouched.
+    """
+
+    partial_path = output_path.with_name(f"{output_path.name}.partial")
+    try:
+        with partial_path.open("wb", buffering=WRITE_BUFFERING) as outfile:
+            yield outfile
+            outfile.flush()
+            os.fsync(outfile.fileno())
+        os.replace(partial_path, output_path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
 
 
 def convert_jsonl_to_csv(jsonl_path: Path, csv_path: Path) -> None:
-    fieldnames = ["id", "parent_id", "author", "text", "published_at", "like_count"]
+    fieldnames = list(Comment._fields)
     csv_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with jsonl_path.open("r", encoding="utf-8") as infile, csv_path.open(
+    with jsonl_path.open("rb", buffering=WRITE_BUFFERING) as infile, csv_path.open(
         "w", encoding="utf-8", newline=""
     ) as outfile:
         writer = csv.DictWriter(outfile, fieldnames=fieldnames)
         writer.writeheader()
 
         for line in infile:
-            record = json.loads(line)
+            record = _loads(line)
             writer.writerow({field: record.get(field) for field in fieldnames})
 
 
@@ -350,15 +997,29 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--buffer-size",
-        type=int,
-        default=DEFAULT_BUFFER_SIZE,
-        help="Number of comments to buffer in memory before flushing to disk (default: %(default)s)",
+        type=parse_buffer_size,
+        default=str(DEFAULT_BUFFER_SIZE),
+        help=(
+            "Output to buffer in memory before flushing to disk: a number of comments, a byte size such "
+            "as 256K, or 'auto' for a few blocks of the output file system (default: %(default)s)"
+        ),
     )
     parser.add_argument(
         "--max-rps",
         type=float,
         default=DEFAULT_MAX_RPS,
-        help="Soft limit on requests per second per worker (default: %(default)s)",
+        help="Soft limit on API requests per second across all workers (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Maximum number of reply listings fetched concurrently within each video (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always query the API instead of reusing responses cached in {DEFAULT_CACHE_PATH}",
     )
     return parser.parse_args()
 
@@ -366,78 +1027,104 @@ def parse_args() -> argparse.Namespace:
 
 
 def main() -> None:
+    global _RESPONSE_CACHE
+
     args = parse_args()
+    if args.no_cache:
+        _RESPONSE_CACHE = None
+    else:
+        try:
+            _RESPONSE_CACHE = _ResponseCache(DEFAULT_CACHE_PATH.expanduser())
+        except RuntimeError:
+            # No home directory to cache under.
+            _RESPONSE_CACHE = None
 
     try:
         api_key = load_api_key(args.token)
-
-        temp_dir = Path(tempfile.mkdtemp(prefix="yt-comments-"))
-        temp_files: list[Path] = []
-        video_ids: list[str] = []
-        total_videos = len(args.videos)
+        # Each video is downloaded once, however many times (or in whichever form) it was given.
+        video_ids = list(dict.fromkeys(extract_video_id(video) for video in args.videos))
+        total_videos = len(video_ids)
         processed = 0
 
-        try:
+        if args.output:
+            output_path = Path(args.output)
+        elif total_videos == 1:
+            output_path = Path(f"comments_{video_ids[0]}.jsonl")
+        else:
+            raise ValueError(
+                "When downloading multiple videos, --output must be provided to choose the merged filename."
+            )
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        buffer_size = _auto_buffer_limit(output_path.parent) if args.buffer_size == "auto" else args.buffer_size
+
+        # Comments are streamed into the output file: directly when downloading
+        # sequentially, or by appending each worker's temp file as soon as its
+        # video completes when downloading in parallel.
+        with _atomic_output(output_path) as outfile:
             if args.parallel > 1 and total_videos > 1:
                 try:
                     ctx = multiprocessing.get_context("fork")
                 except ValueError:
                     ctx = multiprocessing.get_context()
 
-                with ProcessPoolExecutor(max_workers=args.parallel, mp_context=ctx) as executor:
-                    futures = {
-                        executor.submit(
-                            download_video_comments,
-                            video,
+                rate_limiter = RateLimiter(max_requests_per_second=args.max_rps, mp_context=ctx)
+
+                # Dispatch the largest videos first so a big one does not start last and
+                # leave the other workers idle (longest-processing-time scheduling).
+                comment_counts = fetch_comment_counts(video_ids, api_key, rate_limiter=rate_limiter)
+                videos = sorted(video_ids, key=lambda video_id: -comment_counts.get(video_id, 0))
+
+                temp_dir = Path(tempfile.mkdtemp(prefix="yt-comments-"))
+                try:
+                    with ProcessPoolExecutor(
+                        max_workers=min(args.parallel, total_videos),
+                        mp_context=ctx,
+                        initializer=_init_worker,
+                        initargs=(
                             api_key,
                             temp_dir,
-                            args.buffer_size,
-                            args.max_rps,
-                            show_progress=False,
-                        ): video
-                        for video in args.videos
-                    }
-
-                    for future in as_completed(futures):
-                        video_id, temp_path, _ = future.result()
-                        temp_files.append(temp_path)
-                        video_ids.append(video_id)
-                        processed += 1
-                        print(
-                            f"\rVideos processed: {processed}/{total_videos}",
-                            end="",
-                            flush=True,
-                        )
+                            buffer_size,
+                            rate_limiter,
+                            args.concurrency,
+                            _RESPONSE_CACHE.path if _RESPONSE_CACHE is not None else None,
+                        ),
+                    ) as executor:
+                        futures = {executor.submit(_download_in_worker, video): video for video in videos}
+
+                        for future in as_completed(futures):
+                            _, temp_path, _ = future.result()
+                            with temp_path.open("rb") as infile:
+                                _append_file(infile, outfile)
+                            temp_path.unlink()
+                            processed += 1
+                            print(
+                                f"\rVideos processed: {processed}/{total_videos}",
+                                end="",
+                                flush=True,
+                            )
+                except BaseException:
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+                    raise
+                # Each temp file was unlinked once appended, so the directory is empty by now.
+                os.rmdir(temp_dir)
             else:
-                for idx, video in enumerate(args.videos, start=1):
-                    video_id, temp_path, _ = download_video_comments(
-                        video,
+                rate_limiter = RateLimiter(max_requests_per_second=args.max_rps)
+                for idx, video_id in enumerate(video_ids, start=1):
+                    write_video_comments(
+                        video_id,
                         api_key,
-                        temp_dir,
-                        args.buffer_size,
-                        args.max_rps,
+                        outfile,
+                        buffer_size,
+                        rate_limiter,
                         show_progress=True,
+                        concurrency=args.concurrency,
                     )
-                    temp_files.append(temp_path)
-                    video_ids.append(video_id)
                     processed = idx
                     print(f"\rVideos processed: {processed}/{total_videos}", end="", flush=True)
 
-            print()
-            if args.output:
-                output_path = Path(args.output)
-            elif total_videos == 1:
-                output_path = Path(f"comments_{video_ids[0]}.jsonl")
-            else:
-                raise ValueError(
-                    "When downloading multiple videos, --output must be provided to choose the merged filename."
-                )
-            merge_temp_files(temp_files, output_path)
-            convert_jsonl_to_csv(output_path, output_path.with_suffix(".csv"))
-        finally:
-            shutil.rmtree(temp_dir, ignore_errors=True)
-
+        print()
         csv_output = output_path.with_suffix(".csv")
+        convert_jsonl_to_csv(output_path, csv_output)
         print(
             f"Wrote comments to {output_path.resolve()} and CSV to {csv_output.resolve()}"
         )